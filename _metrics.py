@@ -0,0 +1,96 @@
+import hashlib
+import inspect
+import logging
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# ---------- OPTIONAL NUMBA ----------
+# Numba is an optional speed-up; without it we fall back to the vectorized NumPy kernel.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Ahead-of-time build of the loop kernel (see tools/build_metrics_aot.py). When
+# present it skips JIT compilation on a cold start and needs no numba at runtime.
+try:
+    import metrics_aot
+except ImportError:
+    metrics_aot = None
+
+
+def _compute_metrics_numpy(c):
+    """Daily return, cumulative return and max drawdown from close prices.
+
+    `c` is either a single price series or a (dates, tickers) matrix; every
+    operation runs along axis 0, so each column is handled independently.
+    """
+    # Write returns into a preallocated array; the first row has no prior close,
+    # and a return off a zero close is undefined, so both stay NaN
+    dr = np.full_like(c, np.nan)
+    np.divide(np.diff(c, axis=0), c[:-1], out=dr[1:], where=c[:-1] != 0)
+    cr = c / c[0] - 1  # compounded return relative to the first close
+    dd = c / np.maximum.accumulate(c) - 1
+    return dr, cr, dd
+
+
+def _compute_metrics_loop(c):
+    """Same metrics as `_compute_metrics_numpy`, in a single pass for the JIT."""
+    n = c.shape[0]
+    dr = np.empty(n)
+    cr = np.empty(n)
+    dd = np.empty(n)
+    dr[0] = np.nan
+    cr[0] = 0.0
+    dd[0] = 0.0
+    peak = c[0]
+    for i in range(1, n):
+        dr[i] = c[i] / c[i - 1] - 1 if c[i - 1] != 0 else np.nan
+        # Taken from the first close rather than a running product of returns,
+        # which a zero close would turn into 0 * inf = NaN for the rest of the series
+        cr[i] = c[i] / c[0] - 1
+        if c[i] > peak:
+            peak = c[i]
+        dd[i] = c[i] / peak - 1
+    return dr, cr, dd
+
+
+def kernel_source_hash():
+    """SHA-256 of the loop kernel's source, recorded next to each AOT build."""
+    return hashlib.sha256(inspect.getsource(_compute_metrics_loop).encode()).hexdigest()
+
+
+def _aot_is_current():
+    # A build whose recorded hash differs was compiled from older kernel code
+    try:
+        built = Path(metrics_aot.__file__).with_name("metrics_aot.sha256").read_text().strip()
+    except OSError:
+        return False
+    return built == kernel_source_hash()
+
+
+_use_aot = metrics_aot is not None and _aot_is_current()
+if metrics_aot is not None and not _use_aot:
+    logger.warning("Ignoring stale metrics_aot build; rerun `python -m tools.build_metrics_aot`")
+
+if _use_aot:
+    KERNEL = "aot"
+
+    def compute_metrics(c):
+        # The AOT export is compiled for float64 arrays only
+        return metrics_aot.compute_metrics(np.asarray(c, dtype=np.float64))
+elif njit is not None:
+    KERNEL = "numba"
+    # error_model="numpy" gives inf/NaN on division by zero instead of raising
+    compute_metrics = njit(cache=True, error_model="numpy")(_compute_metrics_loop)
+else:
+    KERNEL = "numpy"
+    compute_metrics = _compute_metrics_numpy
+
+logger.info("Using %s metrics kernel", KERNEL)
+
+# The JIT kernel is 1-D only; the NumPy one handles a whole watchlist in one shot
+compute_metrics_matrix = _compute_metrics_numpy
@@ -1,8 +1,9 @@
 from datetime import date, timedelta
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import streamlit as st
-import yfinance as yf
+
+from lib.data import build_price_figure, get_stock_data, normalize_ticker
 
 # ---------- PAGE CONFIG ----------
 st.set_page_config(page_title="Stock Market Dashboard - Metrics", layout="wide")
@@ -10,7 +11,7 @@ st.title("📊 Stock Market Dashboard")
 st.subheader("Iteration 1b: Key Statistics and Metrics")
 
 # ---------- USER INPUT ----------
-ticker_symbol = st.text_input("Enter Stock Ticker Symbol", "AAPL").upper().strip()
+ticker_symbol = normalize_ticker(st.text_input("Enter Stock Ticker Symbol", "AAPL"))
 
 col1, col2 = st.columns(2)
 with col1:
@@ -24,38 +25,6 @@ if start_date > end_date or start_date > date.today() or end_date > date.today()
     st.stop()
 
 # ---------- FETCH & PROCESS DATA ----------
-
-@st.cache_data(ttl=3600)
-def get_stock_data(ticker, start, end):
-    try:
-        df = yf.download(ticker, start=start, end=end, group_by="ticker")
-
-        if df.empty:
-            return None
-
-        # ✅ Flatten MultiIndex by joining both levels (e.g., ('Close', 'AAPL') → 'Close_AAPL')
-        if isinstance(df.columns, pd.MultiIndex):
-            df.columns = ['_'.join([str(i) for i in col if i]) for col in df.columns]
-
-        # ✅ Try to find the 'Close' column dynamically
-        close_candidates = [col for col in df.columns if "close" in col.lower()]
-        if not close_candidates:
-            st.error("No 'Close' column found in the data.")
-            return None
-
-        close_col = close_candidates[0]
-        df["Close"] = df[close_col]  # Standardize for later access
-
-        # ✅ Add calculated metrics
-        df["Daily Return"] = df["Close"].pct_change()
-        df["Cumulative Return"] = (1 + df["Daily Return"]).cumprod() - 1
-        df["Max Drawdown"] = (df["Close"] / df["Close"].cummax()) - 1
-
-        return df
-    except Exception as e:
-        st.error(f"Error fetching data: {e}")
-        return None
-
 with st.spinner(f"Loading data for {ticker_symbol}..."):
     stock_data = get_stock_data(ticker_symbol, start_date, end_date)
 
@@ -66,55 +35,22 @@ if stock_data is None:
 # ---------- CHART ----------
 st.subheader("📈 Stock Price Over Time")
 
-# Defensive copy
-plot_df = stock_data.copy().reset_index()
-
-# Diagnostic output (remove before final submission)
-st.write("DataFrame preview:", plot_df.head())
-st.write("DataFrame columns:", plot_df.columns.tolist())
-
-# Ensure 'Date' and 'Close' exist
-if "Date" not in plot_df.columns:
-    # If the first column looks like a date, rename it
-    possible_date = plot_df.columns[0]
-    if pd.api.types.is_datetime64_any_dtype(plot_df[possible_date]):
-        plot_df.rename(columns={possible_date: "Date"}, inplace=True)
-    else:
-        st.error("No 'Date' column found or inferred.")
-        st.stop()
-
-if "Close" not in plot_df.columns:
-    # Try to infer from possible multi-named columns
-    close_candidates = [col for col in plot_df.columns if "close" in col.lower()]
-    if close_candidates:
-        plot_df["Close"] = plot_df[close_candidates[0]]
-    else:
-        st.error("No 'Close' column found in the data.")
-        st.stop()
+# Diagnostic output, only when debugging from the sidebar
+if st.sidebar.checkbox("Debug"):
+    st.write("DataFrame preview:", stock_data.head())
+    st.write("DataFrame columns:", stock_data.columns.tolist())
 
 # Final safety check
-if plot_df["Close"].dropna().empty:
+if stock_data["Close"].dropna().empty:
     st.error("Close column contains only null values.")
     st.stop()
 
 # Plot the chart
-fig = px.line(
-    plot_df,
-    x="Date",
-    y="Close",
-    title=f"{ticker_symbol} Closing Price",
-    labels={"Close": "Price (USD)", "Date": "Date"},
-    template="plotly_white",
-)
-
-fig.update_layout(
-    xaxis_title="Date",
-    yaxis_title="Price (USD)",
-    hovermode="x unified",
-    height=500,
-)
-fig.update_xaxes(rangeslider_visible=True)
+close_bytes = stock_data["Close"].to_numpy().tobytes()
+show_rangeslider = st.checkbox("Show range slider", value=False)
+fig = build_price_figure(ticker_symbol, start_date, end_date, close_bytes, stock_data, show_rangeslider)
 st.plotly_chart(fig, use_container_width=True)
+
 # ---------- METRIC CARDS ----------
 st.subheader("📌 Key Performance Metrics")
 
@@ -132,17 +68,36 @@ col4.metric("⛔ Max Drawdown", f"{max_drawdown:.2%}")
 # ---------- DATA TABLE ----------
 st.subheader("📅 Historical Data with Daily Returns")
 
-table_df = stock_data[["Close", "Daily Return"]].reset_index()
-table_df.rename(columns={"Date": "Date", "Close": "Close Price"}, inplace=True)
+# Winners/losers summary in place of per-cell green/red coloring
+returns = stock_data["Daily Return"].to_numpy()
+up_days = int(np.count_nonzero(returns > 0))
+down_days = int(np.count_nonzero(returns < 0))
 
-def highlight_returns(val):
-    if pd.isna(val):
-        return ""
-    return "color: green" if val > 0 else "color: red"
+col1, col2 = st.columns(2)
+col1.metric("🟢 Up Days", up_days)
+col2.metric("🔴 Down Days", down_days)
+
+show_all = st.checkbox("Show all rows")
+if show_all:
+    recent = stock_data
+else:
+    n_rows = st.slider("Rows to show", 20, 500, 100)
+    recent = stock_data.tail(n_rows)
+
+# A plain numeric frame goes over Streamlit's Arrow path; formatting is done
+# client-side by column_config instead of per-cell Styler CSS
+table_df = pd.DataFrame({
+    "Date": recent.index,
+    "Close Price": recent["Close"].to_numpy(),
+    "Daily Return": recent["Daily Return"].to_numpy() * 100,
+})
 
 st.dataframe(
-    table_df.style
-        .format({"Close Price": "${:.2f}", "Daily Return": "{:.2%}"})
-        .applymap(highlight_returns, subset=["Daily Return"]),
+    table_df,
+    column_config={
+        "Close Price": st.column_config.NumberColumn(format="$%.2f"),
+        "Daily Return": st.column_config.NumberColumn(format="%.2f%%"),
+    },
+    hide_index=True,
     use_container_width=True
 )
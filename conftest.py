@@ -0,0 +1 @@
+# Lets pytest import the top-level app modules (_metrics, lib, tools) from tests/
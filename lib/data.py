@@ -0,0 +1,127 @@
+"""Data fetching, metrics and figure building shared by every page.
+
+Streamlit keys its caches on function identity, so defining these once here
+means all pages hit the same `st.cache_data` entries instead of each page
+fetching and building its own copy.
+"""
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from _metrics import compute_metrics, compute_metrics_matrix
+from tools.cache import cached_download, cached_download_many
+
+# The only columns any page reads; everything else is dropped before caching
+STOCK_COLUMNS = ["Close", "Daily Return", "Cumulative Return", "Max Drawdown"]
+
+# Hash dates by their ordinal so the cache key is just the calendar day
+_HASH_FUNCS = {date: lambda d: d.toordinal()}
+
+
+def normalize_ticker(ticker):
+    return ticker.strip().upper()
+
+
+def parse_tickers(text):
+    """Normalized, de-duplicated tickers from comma-separated input, in input order."""
+    return tuple(dict.fromkeys(normalize_ticker(t) for t in text.split(",") if t.strip()))
+
+
+def get_stock_data(ticker, start, end):
+    # Normalize before the cached call so "aapl " and "AAPL" share a cache entry
+    return _get_stock_data(normalize_ticker(ticker), start, end)
+
+
+@st.cache_data(ttl=3600, hash_funcs=_HASH_FUNCS)
+def _get_stock_data(ticker, start, end):
+    try:
+        # RAM cache (st.cache_data) in front of the on-disk cache in front of Yahoo
+        df = cached_download(ticker, start, end)
+
+        if df.empty:
+            return None
+
+        # ✅ Add calculated metrics in one pass over the Close prices
+        c = df["Close"].to_numpy(dtype=np.float64, copy=False)
+        dr, cr, mdd = compute_metrics(c)
+        df[["Daily Return", "Cumulative Return", "Max Drawdown"]] = np.column_stack([dr, cr, mdd])
+
+        # ✅ float32 is plenty for the return ratios and halves their payload; Close
+        # stays float64 because float32 cannot hold cents on large share prices
+        for col in ["Daily Return", "Cumulative Return", "Max Drawdown"]:
+            df[col] = df[col].astype(np.float32)
+
+        return df[STOCK_COLUMNS]
+    except Exception as e:
+        st.error(f"Error fetching data: {e}")
+        return None
+
+
+# `tickers` is expected to come from parse_tickers, which has already normalized them
+@st.cache_data(ttl=3600, hash_funcs=_HASH_FUNCS)
+def get_comparison_data(tickers, start, end):
+    try:
+        closes = cached_download_many(tickers, start, end)
+
+        # Align on the dates every ticker traded so the matrix has no gaps
+        closes = closes.dropna()
+        if closes.empty:
+            return None
+
+        # ✅ Metrics for every ticker at once over the (dates, tickers) matrix
+        c = closes.to_numpy(dtype=np.float64)
+        dr, cr, mdd = compute_metrics_matrix(c)
+
+        cumulative = pd.DataFrame(cr, index=closes.index, columns=closes.columns, dtype=np.float32)
+        summary = pd.DataFrame(
+            {
+                "Total Return": cr[-1],
+                "Avg Daily Return": np.nanmean(dr, axis=0),
+                "Volatility": np.nanstd(dr, axis=0, ddof=1),
+                "Max Drawdown": mdd.min(axis=0),
+            },
+            index=closes.columns,
+        )
+        return cumulative, summary
+    except Exception as e:
+        st.error(f"Error fetching comparison data: {e}")
+        return None
+
+
+# Keyed on the raw Close bytes so the cached Figure is rebuilt whenever the data changes
+@st.cache_resource(max_entries=32, ttl=3600, hash_funcs=_HASH_FUNCS)
+def build_price_figure(ticker, start, end, close_bytes, _stock_data, rangeslider=False):
+    fig = px.line(
+        x=_stock_data.index,
+        y=_stock_data["Close"],
+        title=f"{ticker} Closing Price",
+        labels={"x": "Date", "y": "Price (USD)"},
+        template="plotly_white",
+    )
+
+    fig.update_layout(
+        xaxis_title="Date",
+        yaxis_title="Price (USD)",
+        hovermode="x unified",
+        height=500,
+    )
+    # The range slider redraws the whole series a second time, so it is opt-in
+    if rangeslider:
+        fig.update_xaxes(rangeslider_visible=True)
+    return fig
+
+
+# Keyed on the cumulative-return bytes, as build_price_figure is on Close
+@st.cache_resource(max_entries=32, ttl=3600)
+def build_comparison_figure(tickers, cumulative_bytes, _cumulative):
+    fig = px.line(
+        _cumulative,
+        title="Cumulative Return Comparison",
+        labels={"value": "Cumulative Return", "index": "Date", "variable": "Ticker"},
+        template="plotly_white",
+    )
+    fig.update_layout(yaxis_tickformat=".0%", hovermode="x unified", height=500)
+    return fig
@@ -0,0 +1,63 @@
+from datetime import date, timedelta
+import streamlit as st
+
+from lib.data import build_comparison_figure, get_comparison_data, parse_tickers
+
+# ---------- PAGE CONFIG ----------
+st.set_page_config(page_title="Stock Market Dashboard - Compare", layout="wide")
+st.title("📊 Stock Market Dashboard")
+st.subheader("⚖️ Compare Tickers")
+
+# ---------- USER INPUT ----------
+compare_input = st.text_input("Tickers to compare (comma-separated)", "AAPL, MSFT, GOOGL")
+tickers = parse_tickers(compare_input)
+
+col1, col2 = st.columns(2)
+with col1:
+    start_date = st.date_input("Start Date", date.today() - timedelta(days=365))
+with col2:
+    end_date = st.date_input("End Date", date.today())
+
+# ---------- INPUT VALIDATION ----------
+if not tickers:
+    st.info("Enter one or more ticker symbols to compare.")
+    st.stop()
+
+if start_date > end_date or start_date > date.today() or end_date > date.today():
+    st.warning("Please enter a valid date range.")
+    st.stop()
+
+# ---------- FETCH & PROCESS DATA ----------
+with st.spinner(f"Loading data for {', '.join(tickers)}..."):
+    comparison = get_comparison_data(tickers, start_date, end_date)
+
+if comparison is None:
+    st.error("No overlapping data found for the requested tickers.")
+    st.stop()
+
+cumulative, summary = comparison
+
+# cached_download_many skips tickers Yahoo has no data for; say so rather than
+# quietly comparing fewer tickers than were asked for
+missing = [t for t in tickers if t not in summary.index]
+if missing:
+    st.warning(f"No data found for {', '.join(missing)}; comparing the remaining tickers.")
+
+# ---------- CHART ----------
+cumulative_bytes = cumulative.to_numpy().tobytes()
+fig = build_comparison_figure(tuple(cumulative.columns), cumulative_bytes, cumulative)
+st.plotly_chart(fig, use_container_width=True)
+
+# ---------- SUMMARY TABLE ----------
+# Percentages are scaled here and formatted client-side via column_config,
+# which keeps the table on Streamlit's Arrow path instead of Styler HTML
+st.dataframe(
+    summary * 100,
+    column_config={
+        "Total Return": st.column_config.NumberColumn(format="%.2f%%"),
+        "Avg Daily Return": st.column_config.NumberColumn(format="%.3f%%"),
+        "Volatility": st.column_config.NumberColumn(format="%.3f%%"),
+        "Max Drawdown": st.column_config.NumberColumn(format="%.2f%%"),
+    },
+    use_container_width=True
+)
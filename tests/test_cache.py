@@ -0,0 +1,61 @@
+from datetime import date
+
+import pandas as pd
+
+from tools.cache import FileCache
+
+
+START, END = date(2024, 1, 1), date(2024, 6, 30)
+
+
+def _frame():
+    return pd.DataFrame({"Close": [1.0, 2.0, 3.0]}, index=pd.date_range("2024-01-01", periods=3, name="Date"))
+
+
+def _files(cache, ticker):
+    return sorted(p.suffix for p in (cache.root / ticker).iterdir())
+
+
+def test_get_returns_live_entry(tmp_path):
+    cache = FileCache(tmp_path)
+    cache.put("AAPL", START, END, "1d", _frame(), ttl_seconds=3600)
+    pd.testing.assert_frame_equal(cache.get("AAPL", START, END, "1d"), _frame(), check_freq=False)
+
+
+def test_get_after_ttl_removes_both_files(tmp_path):
+    cache = FileCache(tmp_path)
+    cache.put("AAPL", START, END, "1d", _frame(), ttl_seconds=-1)
+    assert _files(cache, "AAPL") == [".meta", ".parquet"]
+
+    assert cache.get("AAPL", START, END, "1d") is None
+    assert _files(cache, "AAPL") == []
+
+
+def test_prune_keeps_live_entries(tmp_path):
+    cache = FileCache(tmp_path)
+    cache.put("AAPL", START, date(2024, 7, 1), "1d", _frame(), ttl_seconds=3600)
+    cache.put("AAPL", START, END, "1d", _frame(), ttl_seconds=-1)
+    assert _files(cache, "AAPL") == [".meta", ".meta", ".parquet", ".parquet"]
+
+    cache.prune("AAPL")
+
+    assert _files(cache, "AAPL") == [".meta", ".parquet"]
+    assert cache.get("AAPL", START, date(2024, 7, 1), "1d") is not None
+
+
+def test_put_with_unwritable_root_does_not_raise(tmp_path):
+    # A regular file where the cache directory should be makes every mkdir fail
+    root = tmp_path / "not-a-dir"
+    root.write_text("")
+    cache = FileCache(root)
+
+    cache.put("AAPL", START, END, "1d", _frame(), ttl_seconds=3600)
+    assert cache.get("AAPL", START, END, "1d") is None
+
+
+def test_unsafe_tickers_are_never_cached(tmp_path):
+    cache = FileCache(tmp_path / "cache")
+    for ticker in ["..", "../AAPL", "/tmp/AAPL", "a/b"]:
+        cache.put(ticker, START, END, "1d", _frame(), ttl_seconds=3600)
+        assert cache.get(ticker, START, END, "1d") is None
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,44 @@
+import numpy as np
+
+from _metrics import _compute_metrics_loop, _compute_metrics_numpy, compute_metrics, compute_metrics_matrix
+
+
+CLOSES = np.array([10.0, 11.0, 10.5, 12.0, 9.0, 13.0, 12.5])
+
+
+def test_numpy_and_loop_kernels_match():
+    for expected, actual in zip(_compute_metrics_loop(CLOSES), _compute_metrics_numpy(CLOSES)):
+        np.testing.assert_allclose(actual, expected, equal_nan=True)
+
+
+def test_dispatched_kernel_matches_numpy():
+    # compute_metrics is the AOT, JIT or NumPy kernel depending on what is installed
+    for expected, actual in zip(_compute_metrics_numpy(CLOSES), compute_metrics(CLOSES)):
+        np.testing.assert_allclose(actual, expected, equal_nan=True)
+
+
+def test_known_values():
+    dr, cr, dd = _compute_metrics_numpy(CLOSES)
+    assert np.isnan(dr[0])
+    np.testing.assert_allclose(dr[1], 0.1)
+    np.testing.assert_allclose(cr, CLOSES / CLOSES[0] - 1)
+    np.testing.assert_allclose(dd[4], 9.0 / 12.0 - 1)
+    assert dd.max() == 0.0
+
+
+def test_matrix_kernel_matches_per_column():
+    matrix = np.column_stack([CLOSES, CLOSES[::-1]])
+    dr, cr, dd = compute_metrics_matrix(matrix)
+    for j in range(matrix.shape[1]):
+        for expected, actual in zip(_compute_metrics_loop(matrix[:, j].copy()), (dr[:, j], cr[:, j], dd[:, j])):
+            np.testing.assert_allclose(actual, expected, equal_nan=True)
+
+
+def test_non_positive_close_keeps_drawdown_finite():
+    # Futures can settle at or below zero (CL=F closed at -37.63 on 2020-04-20)
+    closes = np.array([20.0, 10.0, -37.63, 0.0, 15.0, 25.0])
+    dr, cr, dd = _compute_metrics_numpy(closes)
+    assert np.isfinite(cr).all()
+    assert np.isfinite(dd).all()
+    for expected, actual in zip(_compute_metrics_loop(closes), (dr, cr, dd)):
+        np.testing.assert_allclose(actual, expected, equal_nan=True)
@@ -0,0 +1,32 @@
+"""Compile the metrics loop ahead of time into a `metrics_aot` extension module.
+
+Run from the repository root after installing numba:
+
+    python -m tools.build_metrics_aot
+
+The extension is written next to `_metrics.py` together with
+`metrics_aot.sha256`, the hash of the kernel source it was built from.
+`_metrics.py` prefers the extension to the JIT kernel, so the first Streamlit
+run does not pay for LLVM compilation. If the kernel has been edited since the
+build, the hash no longer matches and the extension is ignored.
+
+Note that `numba.pycc` is deprecated upstream and will be removed in a future
+numba release. Without it, the `@njit(cache=True)` kernel still caches its
+compiled code on disk after the first run.
+"""
+from pathlib import Path
+
+from numba.pycc import CC
+
+from _metrics import _compute_metrics_loop, kernel_source_hash
+
+ROOT = Path(__file__).resolve().parent.parent
+
+cc = CC("metrics_aot")
+cc.output_dir = str(ROOT)
+cc.export("compute_metrics", "UniTuple(f8[:], 3)(f8[:])")(_compute_metrics_loop)
+
+
+if __name__ == "__main__":
+    cc.compile()
+    (ROOT / "metrics_aot.sha256").write_text(kernel_source_hash() + "\n")
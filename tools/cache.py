@@ -0,0 +1,188 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+import yfinance as yf
+
+# ---------- TTLs BY DATA CADENCE ----------
+# End-of-day bars only change once per session; intraday bars go stale much faster.
+EOD_TTL = 24 * 3600
+INTRADAY_TTL = 3600
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache"
+# Bump when the shape of cached frames changes so stale entries are never read back
+CACHE_VERSION = 3
+
+# Tickers become directory names, so only plain symbols (AAPL, BRK-A, ^GSPC, CL=F)
+# are cached; the leading character can't be a dot, which rules out "." and ".."
+_TICKER_RE = re.compile(r"[A-Z0-9^=\-][A-Z0-9.^=\-]*")
+
+
+def ttl_for_interval(interval):
+    """Pick a cache TTL that matches how often bars of this interval change."""
+    return EOD_TTL if interval in ("1d", "5d", "1wk", "1mo", "3mo") else INTRADAY_TTL
+
+
+def _atomic_write(path, write):
+    """Write to a temp file beside `path`, then swap it in with os.replace.
+
+    Streamlit sessions are threads in one process, so a reader must never see a
+    half-written file (prune would take a truncated .meta for an expired one).
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+class FileCache:
+    """Parquet-backed DataFrame cache that survives Streamlit restarts."""
+
+    def __init__(self, root=CACHE_DIR):
+        self.root = Path(root)
+
+    def _ticker_dir(self, ticker):
+        # None for anything that could resolve outside the cache root
+        return self.root / ticker if _TICKER_RE.fullmatch(ticker) else None
+
+    def _paths(self, ticker, start, end, interval):
+        ticker_dir = self._ticker_dir(ticker)
+        if ticker_dir is None:
+            return None
+        key = hashlib.md5(f"{start}|{end}|{interval}|v{CACHE_VERSION}".encode()).hexdigest()
+        base = ticker_dir / key
+        return base.with_suffix(".parquet"), base.with_suffix(".meta")
+
+    def get(self, ticker, start, end, interval):
+        paths = self._paths(ticker, start, end, interval)
+        if paths is None:
+            return None
+        data_path, meta_path = paths
+        try:
+            meta = json.loads(meta_path.read_text())
+            if time.time() - meta["fetched_at"] > meta["ttl_seconds"]:
+                # Keys include the end date, so stale entries are never hit again; remove them
+                data_path.unlink(missing_ok=True)
+                meta_path.unlink(missing_ok=True)
+                return None
+            return pd.read_parquet(data_path)
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def prune(self, ticker):
+        """Delete every expired entry for `ticker`."""
+        ticker_dir = self._ticker_dir(ticker)
+        if ticker_dir is None:
+            return
+        now = time.time()
+        for meta_path in ticker_dir.glob("*.meta"):
+            try:
+                meta = json.loads(meta_path.read_text())
+                expired = now - meta["fetched_at"] > meta["ttl_seconds"]
+            except (OSError, ValueError, KeyError):
+                expired = True
+            if expired:
+                meta_path.with_suffix(".parquet").unlink(missing_ok=True)
+                meta_path.unlink(missing_ok=True)
+
+    def put(self, ticker, start, end, interval, df, ttl_seconds):
+        paths = self._paths(ticker, start, end, interval)
+        if paths is None:
+            return
+        data_path, meta_path = paths
+        try:
+            # Entries for yesterday's date range are never requested again, so
+            # sweep this ticker's expired files before writing a new one
+            self.prune(ticker)
+            data_path.parent.mkdir(parents=True, exist_ok=True)
+            meta = json.dumps({"fetched_at": time.time(), "ttl_seconds": ttl_seconds})
+            # Data first, then meta: an entry only counts once its .meta is in place
+            _atomic_write(data_path, df.to_parquet)
+            _atomic_write(meta_path, lambda tmp: Path(tmp).write_text(meta))
+        except (OSError, TypeError, ValueError):
+            # A read-only or full disk should never break the dashboard; just skip caching
+            pass
+
+
+_cache = FileCache()
+
+
+def _close_frame(close):
+    """The one shape both download paths cache: NaN-free Close on a tz-naive index."""
+    close = close.dropna()
+    if close.index.tz is not None:
+        close = close.tz_localize(None)
+    return close.to_frame("Close")
+
+
+def cached_download(ticker, start, end, interval="1d", ttl=None):
+    """Adjusted Close prices for one ticker, with an on-disk cache in front of Yahoo."""
+    ttl = ttl_for_interval(interval) if ttl is None else ttl
+
+    df = _cache.get(ticker, start, end, interval)
+    if df is not None:
+        return df
+
+    # Ticker.history returns flat columns, so there is no MultiIndex to unpick
+    df = yf.Ticker(ticker).history(start=start, end=end, interval=interval, auto_adjust=True, actions=False)
+    if df.empty:
+        return df
+
+    df = _close_frame(df["Close"])
+    if df.empty:
+        return df
+    _cache.put(ticker, start, end, interval, df, ttl)
+    return df
+
+
+def cached_download_many(tickers, start, end, interval="1d", ttl=None):
+    """Adjusted Close prices for several tickers, one column each.
+
+    Tickers already on disk are served from the cache; the rest are fetched
+    in a single threaded `yf.download` call so their HTTP requests overlap.
+    """
+    ttl = ttl_for_interval(interval) if ttl is None else ttl
+
+    closes = {}
+    missing = []
+    for ticker in tickers:
+        df = _cache.get(ticker, start, end, interval)
+        if df is None:
+            missing.append(ticker)
+        else:
+            closes[ticker] = df["Close"]
+
+    if missing:
+        raw = yf.download(
+            missing,
+            start=start,
+            end=end,
+            interval=interval,
+            group_by="ticker",
+            auto_adjust=True,
+            threads=True,
+            progress=False,
+        )
+        for ticker in missing:
+            if isinstance(raw.columns, pd.MultiIndex):
+                if ticker not in raw.columns.get_level_values(0):
+                    continue
+                df = _close_frame(raw[ticker]["Close"])
+            else:
+                df = _close_frame(raw["Close"])
+            if df.empty:
+                continue
+            _cache.put(ticker, start, end, interval, df, ttl)
+            closes[ticker] = df["Close"]
+
+    # Preserve the order the tickers were requested in
+    return pd.DataFrame({t: closes[t] for t in tickers if t in closes})